@@ -20,9 +20,20 @@ class PostAdmin(admin.ModelAdmin):
     search_fields = ('title',)
     list_filter = ('category',)
     list_display_links = ('title',)
+    list_select_related = ('author', 'location', 'category')
+
+
+class CommentAdmin(admin.ModelAdmin):
+    list_display = (
+        'text',
+        'author',
+        'post',
+        'created_at'
+    )
+    list_select_related = ('author', 'post')
 
 
 admin.site.register(Post, PostAdmin)
 admin.site.register(Category)
 admin.site.register(Location)
-admin.site.register(Comment)
+admin.site.register(Comment, CommentAdmin)
@@ -0,0 +1,24 @@
+"""Кэширование данных публикаций"""
+from uuid import uuid4
+
+from django.core.cache import cache
+
+
+POSTS_CACHE_VERSION_KEY = 'posts:version'
+
+
+def get_posts_cache_version():
+    """Возвращает текущую версию кэша публикаций."""
+    return cache.get_or_set(
+        POSTS_CACHE_VERSION_KEY, lambda: uuid4().hex, None
+    )
+
+
+def invalidate_posts_cache():
+    """Делает недействительными все ключи кэша публикаций."""
+    cache.set(POSTS_CACHE_VERSION_KEY, uuid4().hex, None)
+
+
+def make_posts_cache_key(*parts):
+    """Возвращает ключ кэша с учётом текущей версии."""
+    return ':'.join(('posts', get_posts_cache_version(), *map(str, parts)))
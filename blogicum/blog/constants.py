@@ -1,3 +1,16 @@
 """Константы приложения"""
 
 LIMIT_LENGTH = 256
+
+POST_LIST_FIELDS = (
+    'title', 'text', 'pub_date', 'image', 'is_published', 'comment_count',
+    'author__username',
+    'category__title', 'category__slug', 'category__is_published',
+    'location__name', 'location__is_published',
+)
+
+POSTS_COUNT_CACHE_TIMEOUT = 30
+
+INDEX_PAGE_CACHE_TIMEOUT = 30
+
+CATEGORY_CACHE_TIMEOUT = 60
@@ -46,11 +46,31 @@ class Post(BaseModel):
         upload_to='post_images',
         blank=True
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = [
+            models.Index(
+                fields=['-pub_date'],
+                condition=models.Q(is_published=True),
+                name='post_published_pub_date_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='post_author_pub_date_idx'
+            ),
+            models.Index(
+                fields=['category', '-pub_date'],
+                name='post_category_pub_date_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -114,6 +134,9 @@ class Comment(models.Model):
         ordering = ('created_at',)
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(fields=['post', 'id'], name='comment_post_id_idx'),
+        ]
 
     def __str__(self):
         return self.text
@@ -0,0 +1,59 @@
+from functools import cached_property
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+
+from .constants import POSTS_COUNT_CACHE_TIMEOUT
+
+
+class PKPaginator(Paginator):
+    """Пагинатор, выбирающий сначала первичные ключи записей страницы."""
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_ids = list(
+            self.object_list.values_list('pk', flat=True)[bottom:top]
+        )
+        return self._get_page(
+            self.object_list.filter(pk__in=page_ids), number, self
+        )
+
+
+class CachedCountPaginator(PKPaginator):
+    """Пагинатор, кэширующий общее количество записей."""
+
+    def __init__(self, *args, count_cache_key=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    def get_total_count(self):
+        return super().count
+
+    @cached_property
+    def count(self):
+        if self.count_cache_key is None:
+            return self.get_total_count()
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = self.get_total_count()
+            cache.set(
+                self.count_cache_key, count, POSTS_COUNT_CACHE_TIMEOUT
+            )
+        return count
+
+
+class ShortListPaginator(CachedCountPaginator):
+    """Пагинатор, считающий короткие списки без COUNT."""
+
+    count_limit_pages = 5
+
+    def get_total_count(self):
+        limit = self.per_page * self.count_limit_pages
+        count = len(self.object_list.values_list('pk', flat=True)[:limit + 1])
+        if count <= limit:
+            return count
+        return super().get_total_count()
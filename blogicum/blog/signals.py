@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .caching import invalidate_posts_cache
+from .models import Category, Comment, Location, Post
+
+
+def increase_comment_count(post_id):
+    Post.objects.filter(pk=post_id).update(
+        comment_count=F('comment_count') + 1
+    )
+
+
+def decrease_comment_count(post_id):
+    Post.objects.filter(pk=post_id).update(
+        comment_count=Greatest(F('comment_count') - 1, 0)
+    )
+
+
+@receiver([post_save, post_delete], sender=Post)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Location)
+@receiver(post_delete, sender=get_user_model())
+def reset_posts_cache(**kwargs):
+    invalidate_posts_cache()
+    transaction.on_commit(invalidate_posts_cache)
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(instance, raw, update_fields, **kwargs):
+    instance._previous_post_id = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not {'post', 'post_id'} & update_fields:
+        return
+    instance._previous_post_id = Comment.objects.filter(
+        pk=instance.pk
+    ).values_list('post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def update_comment_count_on_save(instance, created, raw, **kwargs):
+    if created and not raw:
+        increase_comment_count(instance.post_id)
+    elif not raw:
+        previous_post_id = instance._previous_post_id
+        if previous_post_id not in (None, instance.post_id):
+            decrease_comment_count(previous_post_id)
+            increase_comment_count(instance.post_id)
+    reset_posts_cache()
+
+
+@receiver(post_delete, sender=Comment)
+def update_comment_count_on_delete(instance, origin=None, **kwargs):
+    # При каскадном удалении публикации счётчик удаляется вместе с ней,
+    # а кэш сбрасывается один раз сигналом удаляемой публикации
+    # или пользователя.
+    origin_model = getattr(origin, 'model', type(origin))
+    if origin_model is not Post:
+        decrease_comment_count(instance.post_id)
+    if origin_model not in (Post, get_user_model()):
+        reset_posts_cache()
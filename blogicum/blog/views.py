@@ -1,46 +1,51 @@
+from functools import cached_property
+
 from django.shortcuts import get_object_or_404, redirect
 from django.views.generic import (
     CreateView, UpdateView, DeleteView, ListView, DetailView
 )
 from django.urls import reverse_lazy, reverse
-from django.contrib.auth.mixins import UserPassesTestMixin
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
 from django.contrib.auth.views import PasswordChangeView
-from django.db.models import Count
 from django.http import Http404
 from django.utils import timezone
+from django.views.decorators.cache import cache_page
 from django.conf import settings
+from django.core.cache import cache
 
 from .models import Post, Category, Comment
 from .forms import PostForm, CommentForm
 from .forms import UserProfileForm
+from .caching import make_posts_cache_key
+from .constants import (
+    CATEGORY_CACHE_TIMEOUT, INDEX_PAGE_CACHE_TIMEOUT, POST_LIST_FIELDS
+)
+from .paginators import CachedCountPaginator, ShortListPaginator
 
 
-def get_posts_queryset(apply_filters=False, apply_annotation=False):
+def get_posts_queryset(apply_filters=False, apply_only=False,
+                       order_by='-pub_date'):
     """Возвращает запросы для модели Post."""
     queryset = Post.objects.select_related('author', 'location', 'category')
+    if apply_only:
+        queryset = queryset.only(*POST_LIST_FIELDS)
     if apply_filters:
         queryset = queryset.filter(
             is_published=True,
             category__is_published=True,
             pub_date__lte=timezone.now()
         )
-    if apply_annotation:
-        queryset = queryset.annotate(comment_count=Count('comments')
-                                     ).order_by('-pub_date')
-    return queryset
-
+    return queryset.order_by(order_by)
 
-class OnlyAuthorMixin(UserPassesTestMixin):
-    """Миксин для проверки, является ли пользователь автором поста."""
 
-    def test_func(self):
-        object = self.get_object()
-        return object.author == self.request.user
+class OnlyAuthorMixin:
+    """Миксин, ограничивающий выборку объектами текущего пользователя."""
 
-    def handle_no_permission(self):
-        return redirect('blog:index')
+    def get_queryset(self):
+        return super().get_queryset().filter(
+            author_id=self.request.user.pk
+        )
 
     def get_success_url(self):
         return reverse('blog:post_detail',
@@ -53,7 +58,7 @@ class CommentMixin:
 
     def get_object(self, queryset=None):
         return get_object_or_404(
-            Comment,
+            self.get_queryset(),
             id=self.kwargs.get('comment_id'),
             post_id=self.kwargs['post_id']
         )
@@ -63,14 +68,41 @@ class CommentMixin:
                        kwargs={'post_id': self.kwargs.get('post_id')})
 
 
-class PostListView(ListView):
+class PostsPaginationMixin:
+    """Миксин постраничного вывода публикаций."""
+
+    paginate_by = settings.QUANTITY_POSTS_PAGE
+    paginator_class = CachedCountPaginator
+
+    def get_count_cache_key(self):
+        return make_posts_cache_key(
+            'count', type(self).__name__, *self.kwargs.values()
+        )
+
+    def get_paginator(self, *args, **kwargs):
+        return super().get_paginator(
+            *args, count_cache_key=self.get_count_cache_key(), **kwargs
+        )
+
+
+class PostListView(PostsPaginationMixin, ListView):
     """Вернет путь к главной странице проекта."""
 
     template_name = 'blog/index.html'
-    paginate_by = settings.QUANTITY_POSTS_PAGE
-    queryset = get_posts_queryset(
-        apply_filters=True,
-        apply_annotation=True)
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        return cache_page(
+            INDEX_PAGE_CACHE_TIMEOUT,
+            key_prefix=make_posts_cache_key('index')
+        )(super().dispatch)(request, *args, **kwargs)
+
+    def get_queryset(self):
+        return get_posts_queryset(
+            apply_filters=True,
+            apply_only=True
+        )
 
 
 class PostDetailView(DetailView):
@@ -83,10 +115,11 @@ class PostDetailView(DetailView):
 
     def get_object(self, queryset=None):
         post = get_object_or_404(
-            Post.objects.select_related(
-                'author', 'location', 'category'), pk=self.kwargs['post_id']
+            Post.objects.select_related('author', 'location', 'category'),
+            pk=self.kwargs['post_id']
         )
-        if (post.author != self.request.user
+        user = self.request.user
+        if (post.author_id != user.pk
             and (not post.is_published
                  or not post.category.is_published
                  or post.pub_date > timezone.now())):
@@ -96,67 +129,76 @@ class PostDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related('author')
+        context['comments'] = self.object.comments.values(
+            'id', 'text', 'created_at', 'author_id', 'author__username'
+        )
         return context
 
 
-class CategoryPostListView(ListView):
+class CategoryPostListView(PostsPaginationMixin, ListView):
     """Вернет путь к странице категории."""
 
     template_name = 'blog/category.html'
-    paginate_by = settings.QUANTITY_POSTS_PAGE
     context_object_name = 'post_list'
 
-    def get_category(self):
+    @cached_property
+    def category(self):
         category_slug = self.kwargs['category_slug']
-        return get_object_or_404(
-            Category,
-            is_published=True,
-            slug=category_slug
+        return cache.get_or_set(
+            make_posts_cache_key('category', category_slug),
+            lambda: get_object_or_404(
+                Category,
+                is_published=True,
+                slug=category_slug
+            ),
+            CATEGORY_CACHE_TIMEOUT
         )
 
     def get_queryset(self):
         queryset = get_posts_queryset(
             apply_filters=True,
-            apply_annotation=True
+            apply_only=True
         )
-        category = self.get_category()
         post_list = queryset.filter(
-            category=category
+            category=self.category
         )
         return post_list
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        category = self.get_category()
-        context['category'] = category
+        context['category'] = self.category
         return context
 
 
-class UserProfileView(ListView):
+class UserProfileView(PostsPaginationMixin, ListView):
     """Страница пользователя."""
 
     model = User
     template_name = 'blog/profile.html'
-    paginate_by = settings.QUANTITY_POSTS_PAGE
+    paginator_class = ShortListPaginator
     pk_url_kwarg = 'username'
 
-    def get_user(self, queryset=None):
+    @cached_property
+    def profile_user(self):
         username = self.kwargs.get('username')
         return get_object_or_404(User, username=username)
 
     def get_queryset(self):
-        user = self.get_user()
+        user = self.profile_user
         queryset = get_posts_queryset(
             apply_filters=user != self.request.user,
-            apply_annotation=True
+            apply_only=True
         )
-        queryset = queryset.filter(author=user)
+        queryset = queryset.filter(author_id=user.pk)
         return queryset
 
+    def get_count_cache_key(self):
+        is_owner = self.profile_user == self.request.user
+        return f'{super().get_count_cache_key()}:{is_owner}'
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['profile'] = self.get_user()
+        context['profile'] = self.profile_user
         return context
 
 
@@ -195,10 +237,20 @@ class PostUpdateView(LoginRequiredMixin, OnlyAuthorMixin, UpdateView):
     template_name = 'blog/create.html'
     pk_url_kwarg = 'post_id'
 
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+        return self._object
+
     def dispatch(self, request, *args, **kwargs):
-        post = get_object_or_404(Post, pk=kwargs['post_id'])
-        if request.user != post.author:
-            return redirect('blog:post_detail', post_id=post.id)
+        if request.user.is_authenticated:
+            try:
+                self.get_object()
+            except Http404:
+                post_id = kwargs['post_id']
+                if not Post.objects.filter(pk=post_id).exists():
+                    raise
+                return redirect('blog:post_detail', post_id=post_id)
         return super().dispatch(request, *args, **kwargs)
 
     def get_success_url(self):
@@ -210,15 +262,14 @@ class PostDeleteView(LoginRequiredMixin, OnlyAuthorMixin, DeleteView):
     template_name = 'blog/create.html'
     pk_url_kwarg = 'post_id'
 
-    def get_object(self, queryset=None):
-        return get_object_or_404(Post, pk=self.kwargs['post_id'])
+    def get_queryset(self):
+        return super().get_queryset().select_related('location')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        post = self.get_object()
+        post = self.object
         context['form'] = PostForm(instance=post)
         context['post'] = post
-        context['location'] = post.location
         return context
 
     def get_success_url(self):
@@ -233,21 +284,26 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
     form_class = CommentForm
     template_name = 'comments.html'
 
-    def form_valid(self, form):
-        comment = form.save(commit=False)
-        comment.author = self.request.user
-        comment.post = get_object_or_404(
-            Post,
+    @cached_property
+    def commented_post_id(self):
+        post_id = Post.objects.filter(
             id=self.kwargs['post_id'],
             is_published=True,
             category__is_published=True,
             pub_date__lte=timezone.now()
-        )
-        comment.save()
-        return redirect('blog:post_detail', post_id=comment.post.id)
+        ).values_list('id', flat=True).first()
+        if post_id is None:
+            raise Http404
+        return post_id
+
+    def form_valid(self, form):
+        form.instance.author = self.request.user
+        form.instance.post_id = self.commented_post_id
+        return super().form_valid(form)
 
     def get_success_url(self):
-        return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
+        return reverse('blog:post_detail',
+                       kwargs={'post_id': self.kwargs['post_id']})
 
 
 class CommentUpdateView(LoginRequiredMixin, OnlyAuthorMixin,
@@ -255,6 +311,11 @@ class CommentUpdateView(LoginRequiredMixin, OnlyAuthorMixin,
                         ):
     form_class = CommentForm
 
+    def form_valid(self, form):
+        self.object = form.save(commit=False)
+        self.object.save(update_fields=['text'])
+        return redirect(self.get_success_url())
+
 
 class CommentDeleteView(LoginRequiredMixin, OnlyAuthorMixin,
                         CommentMixin, DeleteView
@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings
+from django.shortcuts import resolve_url
+from django.urls import reverse
+
+from blog.models import Comment, Post
+
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def post(mixer, user):
+    return mixer.blend('blog.Post', author=user, text='text')
+
+
+@pytest.fixture
+def comment(mixer, user, post):
+    return mixer.blend('blog.Comment', author=user, post=post, text='text')
+
+
+def get_urls(post, comment):
+    return [
+        reverse('blog:edit_post', args=(post.pk,)),
+        reverse('blog:delete_post', args=(post.pk,)),
+        reverse('blog:edit_comment', args=(post.pk, comment.pk)),
+        reverse('blog:delete_comment', args=(post.pk, comment.pk)),
+    ]
+
+
+@pytest.mark.parametrize('method', ['get', 'post'])
+def test_anonymous_is_sent_to_login(client, post, comment, method):
+    login_url = resolve_url(settings.LOGIN_URL)
+    for url in get_urls(post, comment):
+        response = getattr(client, method)(url)
+        assert response.status_code == HTTPStatus.FOUND, url
+        assert response['Location'].startswith(login_url), url
+
+
+@pytest.mark.parametrize('method', ['get', 'post'])
+def test_non_author_gets_not_found(
+        another_user_client, post, comment, method
+):
+    for url in get_urls(post, comment)[1:]:
+        response = getattr(another_user_client, method)(url)
+        assert response.status_code == HTTPStatus.NOT_FOUND, url
+    assert Post.objects.filter(pk=post.pk).exists()
+    assert Comment.objects.filter(pk=comment.pk).exists()
+
+
+@pytest.mark.parametrize('method', ['get', 'post'])
+def test_non_author_edit_post_redirects_to_post(
+        another_user_client, post, method
+):
+    response = getattr(another_user_client, method)(
+        reverse('blog:edit_post', args=(post.pk,)), {'text': 'changed'}
+    )
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert response['Location'] == reverse(
+        'blog:post_detail', args=(post.pk,)
+    )
+    assert Post.objects.get(pk=post.pk).text == 'text'
+
+
+def test_edit_missing_post_is_not_found(user_client):
+    response = user_client.get(reverse('blog:edit_post', args=(0,)))
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_author_has_access(user_client, post, comment):
+    for url in get_urls(post, comment):
+        response = user_client.get(url)
+        assert response.status_code == HTTPStatus.OK, url
+
+
+def test_author_can_edit_post(user_client, post):
+    response = user_client.post(
+        reverse('blog:edit_post', args=(post.pk,)),
+        {
+            'title': post.title,
+            'text': 'changed',
+            'pub_date': post.pub_date.strftime('%Y-%m-%dT%H:%M'),
+            'category': post.category_id,
+        }
+    )
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert response['Location'] == reverse(
+        'blog:post_detail', args=(post.pk,)
+    )
+    assert Post.objects.get(pk=post.pk).text == 'changed'
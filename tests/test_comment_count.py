@@ -0,0 +1,72 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Comment, Post
+
+
+pytestmark = [pytest.mark.django_db]
+
+
+def get_comment_counts(*posts):
+    return [
+        Post.objects.values_list('comment_count', flat=True).get(pk=post.pk)
+        for post in posts
+    ]
+
+
+def test_comment_count_follows_create_move_and_delete(mixer, user):
+    post_a, post_b = mixer.cycle(2).blend('blog.Post', author=user)
+
+    comment = Comment.objects.create(text='text', post=post_a, author=user)
+    assert get_comment_counts(post_a, post_b) == [1, 0]
+
+    comment.text = 'edited'
+    comment.save(update_fields=['text'])
+    assert get_comment_counts(post_a, post_b) == [1, 0]
+
+    comment.post = post_b
+    comment.save()
+    assert get_comment_counts(post_a, post_b) == [0, 1]
+
+    comment.post_id = post_a.pk
+    comment.save(update_fields=['post_id'])
+    assert get_comment_counts(post_a, post_b) == [1, 0]
+
+    comment.delete()
+    assert get_comment_counts(post_a, post_b) == [0, 0]
+
+
+def test_comment_count_never_goes_negative(mixer, user):
+    post = mixer.blend('blog.Post', author=user)
+    comment = Comment.objects.create(text='text', post=post, author=user)
+    Post.objects.filter(pk=post.pk).update(comment_count=0)
+
+    comment.delete()
+
+    assert get_comment_counts(post) == [0]
+
+
+def count_post_delete_queries(mixer, user, comments_count):
+    post = mixer.blend('blog.Post', author=user)
+    mixer.cycle(comments_count).blend('blog.Comment', post=post, author=user)
+    with CaptureQueriesContext(connection) as context:
+        post.delete()
+    return len(context)
+
+
+def test_post_delete_queries_do_not_depend_on_comments(mixer, user):
+    assert (
+        count_post_delete_queries(mixer, user, 20)
+        == count_post_delete_queries(mixer, user, 1)
+    )
+
+
+def test_comment_count_follows_commenter_delete(mixer, user, another_user):
+    post = mixer.blend('blog.Post', author=user)
+    mixer.cycle(2).blend('blog.Comment', post=post, author=another_user)
+    Comment.objects.create(text='text', post=post, author=user)
+
+    another_user.delete()
+
+    assert get_comment_counts(post) == [1]
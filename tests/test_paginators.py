@@ -0,0 +1,79 @@
+import pytest
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Post
+from blog.paginators import (
+    CachedCountPaginator, PKPaginator, ShortListPaginator
+)
+
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def get_author_posts(mixer, user, count):
+    mixer.cycle(count).blend('blog.Post', author=user)
+    return Post.objects.filter(author=user).order_by('-pub_date', '-pk')
+
+
+def get_page_ids(paginator, number):
+    return [post.pk for post in paginator.page(number)]
+
+
+@pytest.mark.parametrize('posts_count', [13, 14])
+def test_pk_paginator_last_page_with_orphans(mixer, user, posts_count):
+    queryset = get_author_posts(mixer, user, posts_count)
+    expected = Paginator(queryset, 10, orphans=3)
+    paginator = PKPaginator(queryset, 10, orphans=3)
+
+    assert paginator.num_pages == expected.num_pages
+    for number in expected.page_range:
+        assert get_page_ids(paginator, number) == [
+            post.pk for post in expected.page(number)
+        ]
+
+
+def test_pk_paginator_empty_list(user):
+    paginator = PKPaginator(Post.objects.filter(author=user).order_by('pk'), 10)
+
+    page = paginator.page(1)
+
+    assert paginator.count == 0
+    assert list(page) == []
+    assert not page.has_other_pages()
+
+
+def test_cached_count_paginator_reuses_cached_count(mixer, user):
+    queryset = get_author_posts(mixer, user, 3)
+    assert CachedCountPaginator(queryset, 2, count_cache_key='k').count == 3
+
+    mixer.blend('blog.Post', author=user)
+
+    assert CachedCountPaginator(queryset, 2, count_cache_key='k').count == 3
+    assert CachedCountPaginator(queryset, 2).count == 4
+
+
+@pytest.mark.parametrize('posts_count', [10, 11])
+def test_short_list_paginator_counts_long_lists(mixer, user, posts_count):
+    queryset = get_author_posts(mixer, user, posts_count)
+    paginator = ShortListPaginator(queryset, 2)
+
+    with CaptureQueriesContext(connection) as queries:
+        count = paginator.count
+
+    assert count == posts_count
+    used_count = any('COUNT(' in query['sql'] for query in queries)
+    assert used_count == (posts_count > 2 * paginator.count_limit_pages)
+    last_number = paginator.num_pages
+    assert get_page_ids(paginator, last_number) == [
+        post.pk for post in Paginator(queryset, 2).page(last_number)
+    ]
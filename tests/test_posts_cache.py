@@ -0,0 +1,93 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.caching import make_posts_cache_key
+from blog.models import Comment, Post
+
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def published_post(mixer, user, published_category):
+    return mixer.blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() - timezone.timedelta(days=1),
+    )
+
+
+def get_index(client):
+    return client.get(reverse('blog:index')).content.decode()
+
+
+def test_anonymous_index_is_cached(
+        client, published_post, django_assert_num_queries
+):
+    first = get_index(client)
+
+    with django_assert_num_queries(0):
+        assert get_index(client) == first
+
+
+def test_new_comment_changes_anonymous_index(client, user, published_post):
+    assert 'Комментарии (0)' in get_index(client)
+
+    Comment.objects.create(text='text', post=published_post, author=user)
+
+    assert 'Комментарии (1)' in get_index(client)
+
+
+def test_new_post_changes_anonymous_index(client, mixer, published_post):
+    get_index(client)
+
+    new_post = mixer.blend(
+        'blog.Post',
+        author=published_post.author,
+        category=published_post.category,
+        is_published=True,
+        pub_date=published_post.pub_date,
+    )
+
+    assert new_post.title in get_index(client)
+
+
+def test_authenticated_index_skips_cache(client, user_client, published_post):
+    get_index(client)
+    get_index(user_client)
+    Post.objects.filter(pk=published_post.pk).update(title='Updated title')
+
+    assert 'Updated title' in get_index(user_client)
+    assert 'Updated title' not in get_index(client)
+
+
+def test_unpublished_category_is_not_served_from_cache(
+        client, published_category
+):
+    url = reverse('blog:category_posts', args=(published_category.slug,))
+    assert client.get(url).status_code == HTTPStatus.OK
+
+    published_category.is_published = False
+    published_category.save()
+
+    assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+
+def test_missing_category_is_not_cached(client):
+    url = reverse('blog:category_posts', args=('missing',))
+
+    assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+    assert cache.get(make_posts_cache_key('category', 'missing')) is None